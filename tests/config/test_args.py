@@ -1,6 +1,7 @@
 """Unit tests for ``:mod:zarp.config.args``."""
 
 import argparse
+from copy import copy
 
 import pytest
 
@@ -13,6 +14,27 @@ from zarp.config.enums import (
 VALID_SAMPLE_REF = "SRR1234567"
 
 
+@pytest.fixture(scope="session")
+def base_parser():
+    """Build parser with all arguments set, shared across tests."""
+    parser = ArgParser(args=[])
+    parser.set_parser()
+    parser.set_arguments()
+    return parser
+
+
+@pytest.fixture
+def make_parser(base_parser):
+    """Return factory for copies of shared parser with custom arguments."""
+
+    def _make_parser(args):
+        parser = copy(base_parser)
+        parser.args = args
+        return parser
+
+    return _make_parser
+
+
 class TestArgParser:
     """Test ``:cls:zarp.config.args.ArgParser`` class."""
 
@@ -44,6 +66,23 @@ class TestArgParser:
         parser.set_arguments()
         assert len(parser.parser._action_groups) == 7
 
+    def test_set_arguments_version_only(self):
+        """Test method ``.set_arguments()`` with option `--version` only."""
+        parser = ArgParser(args=["--version"])
+        parser.set_parser()
+        parser.set_arguments()
+        assert len(parser.parser._action_groups) == 4
+
+    def test_set_arguments_version_and_help(self):
+        """Test method ``.set_arguments()``.
+
+        Use options `--version` and `--help`.
+        """
+        parser = ArgParser(args=["--version", "--help"])
+        parser.set_parser()
+        parser.set_arguments()
+        assert len(parser.parser._action_groups) == 7
+
     def test_parse_arguments_no_args(self):
         """Test method ``.parse_arguments()`` with no arguments."""
         args = []
@@ -93,12 +132,10 @@ class TestArgParser:
             parser.parse_arguments()
         assert exc.value.code == 2
 
-    def test_process_arguments_required_args_missing(self):
+    def test_process_arguments_required_args_missing(self, make_parser):
         """Test method ``.process_arguments()`` with no arguments."""
         args = []
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         with pytest.raises(SystemExit) as exc:
             parser.process_arguments()
@@ -108,15 +145,13 @@ class TestArgParser:
         "test_input",
         ["DRY_RUN", "PREPARE_RUN", "RUN"],
     )
-    def test_process_arguments_execution_mode(self, test_input):
+    def test_process_arguments_execution_mode(self, test_input, make_parser):
         """Test method ``.process_arguments()``.
 
         Use different arguments for option `--execution-mode`.
         """
         args = [VALID_SAMPLE_REF, "--execution-mode", test_input]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert parser.args_parsed.execution_mode == ExecModes[test_input].value
@@ -125,15 +160,15 @@ class TestArgParser:
         "test_input",
         ["CONDA", "SINGULARITY"],
     )
-    def test_process_arguments_dependency_embedding(self, test_input):
+    def test_process_arguments_dependency_embedding(
+        self, test_input, make_parser
+    ):
         """Test method ``.process_arguments()``.
 
         Use different arguments for option `--dependency-embedding`.
         """
         args = [VALID_SAMPLE_REF, "--dependency-embedding", test_input]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert (
@@ -141,29 +176,25 @@ class TestArgParser:
             == DependencyEmbeddingStrategies[test_input]
         )
 
-    def test_process_arguments_source_int(self):
+    def test_process_arguments_source_int(self, make_parser):
         """Test method ``.process_arguments()``.
 
         Use an integer identifier for option `--source`.
         """
         args = [VALID_SAMPLE_REF, "--source", "12345"]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert isinstance(parser.args_parsed.source, int)
         assert parser.args_parsed.source == 12345
 
-    def test_process_arguments_source_str(self):
+    def test_process_arguments_source_str(self, make_parser):
         """Test method ``.process_arguments()``.
 
         Use a string identifier for option `--source`.
         """
         args = [VALID_SAMPLE_REF, "--source", "Homo sapiens"]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert isinstance(parser.args_parsed.source, str)
@@ -178,16 +209,16 @@ class TestArgParser:
             ("--adapter-poly-5p", "adapter_poly_5p"),
         ],
     )
-    def test_process_arguments_adapt_single(self, arg_name, arg_var):
+    def test_process_arguments_adapt_single(
+        self, arg_name, arg_var, make_parser
+    ):
         """Test method ``.process_arguments()``.
 
         Use a single sequence for the different types of adapter options.
         """
         sequence = ("ACGTACGT", None)
         args = [VALID_SAMPLE_REF, arg_name, sequence[0]]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert getattr(parser.args_parsed, arg_var) == sequence
@@ -201,7 +232,9 @@ class TestArgParser:
             ("--adapter-poly-5p", "adapter_poly_5p"),
         ],
     )
-    def test_process_arguments_adapt_first_mate(self, arg_name, arg_var):
+    def test_process_arguments_adapt_first_mate(
+        self, arg_name, arg_var, make_parser
+    ):
         """Test method ``.process_arguments()``.
 
         Use a single sequence for the first mates for the different types of
@@ -209,9 +242,7 @@ class TestArgParser:
         """
         sequence = ("ACGTACGT", None)
         args = [VALID_SAMPLE_REF, arg_name, f"{sequence[0]},"]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert getattr(parser.args_parsed, arg_var) == sequence
@@ -225,7 +256,9 @@ class TestArgParser:
             ("--adapter-poly-5p", "adapter_poly_5p"),
         ],
     )
-    def test_process_arguments_adapt_second_mate(self, arg_name, arg_var):
+    def test_process_arguments_adapt_second_mate(
+        self, arg_name, arg_var, make_parser
+    ):
         """Test method ``.process_arguments()``.
 
         Use a single sequence for the second mates for the different types of
@@ -233,9 +266,7 @@ class TestArgParser:
         """
         sequence = (None, "TGCATGCA")
         args = [VALID_SAMPLE_REF, arg_name, f",{sequence[1]}"]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert getattr(parser.args_parsed, arg_var) == sequence
@@ -249,30 +280,49 @@ class TestArgParser:
             ("--adapter-poly-5p", "adapter_poly_5p"),
         ],
     )
-    def test_process_arguments_adapt_paired(self, arg_name, arg_var):
+    def test_process_arguments_adapt_paired(
+        self, arg_name, arg_var, make_parser
+    ):
         """Test method ``.process_arguments()``.
 
         Use two different sequences the different types of adapter options.
         """
         sequence = ("ACGTACGT", "TGCATGCA")
         args = [VALID_SAMPLE_REF, arg_name, ",".join(sequence)]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         assert getattr(parser.args_parsed, arg_var) == sequence
 
-    def test_set_argument_groups(self):
+    @pytest.mark.parametrize(
+        "arg_name",
+        [
+            "--adapter-3p",
+            "--adapter-5p",
+            "--adapter-poly-3p",
+            "--adapter-poly-5p",
+        ],
+    )
+    def test_parse_arguments_adapt_too_many(self, arg_name, make_parser):
+        """Test method ``.parse_arguments()``.
+
+        Use more than two sequences for the different types of adapter
+        options.
+        """
+        args = [VALID_SAMPLE_REF, arg_name, "ACGTACGT,TGCATGCA,ACGTACGT"]
+        parser = make_parser(args)
+        with pytest.raises(SystemExit) as exc:
+            parser.parse_arguments()
+        assert exc.value.code == 2
+
+    def test_set_argument_groups(self, make_parser):
         """Test method ``.set_argument_groups()``.
 
         Check for the presence of the various argument groups.
         """
         KEYS = set(["sample", "run", "user"])
         args = [VALID_SAMPLE_REF]
-        parser = ArgParser(args=args)
-        parser.set_parser()
-        parser.set_arguments()
+        parser = make_parser(args)
         parser.parse_arguments()
         parser.process_arguments()
         parser.set_argument_groups()
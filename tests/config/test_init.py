@@ -21,10 +21,27 @@ from tests.utils import (
 from zarp.config.enums import (
     ExecModes,
 )
-from zarp.config.init import Initializer
+from zarp.config.init import _get_schema, Initializer
 from zarp.config.models import InitConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_caches():
+    """Clear cached schemas so that patched schemas are always used."""
+    _get_schema.cache_clear()
+    Initializer._get_param_types.cache_clear()
+    yield
+    _get_schema.cache_clear()
+    Initializer._get_param_types.cache_clear()
+
+
+def test_get_schema():
+    """Test function ``._get_schema()``."""
+    schema = _get_schema(InitConfig)
+    assert "properties" in schema
+    assert _get_schema(InitConfig) is schema
+
+
 class TestInitializer:
     """Test ``cls:zarp.config.init.Initializer`` class."""
 
@@ -79,7 +96,9 @@ class TestInitializer:
 
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", lambda: "new_author")
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -96,7 +115,9 @@ class TestInitializer:
 
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", lambda: "None")
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -119,7 +140,9 @@ class TestInitializer:
         )
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", mocker)
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -142,7 +165,9 @@ class TestInitializer:
         )
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", mocker)
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -165,7 +190,9 @@ class TestInitializer:
         )
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", mocker)
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -188,7 +215,9 @@ class TestInitializer:
         )
         schema: Dict = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", mocker)
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -218,7 +247,9 @@ class TestInitializer:
         )
         schema = jsonref.loads(InitConfig().schema_json())
         initializer: Initializer = Initializer()
-        monkeypatch.setattr("jsonref.loads", lambda *args: schema)
+        monkeypatch.setattr(
+            "jsonref.replace_refs", lambda *args, **kwargs: schema
+        )
         monkeypatch.setattr("builtins.input", mocker)
         setattr(initializer, "config", InitConfig())
         initializer.set_from_user_input()
@@ -293,6 +324,18 @@ class TestInitializer:
         assert ret[1] == ExecModes
         assert ret[2] is None
 
+    def test_get_param_types(self):
+        """Test method `._get_param_types()`."""
+        param_types = Initializer._get_param_types(model=InitConfig)
+        assert param_types[("run", "cores")] == ("integer", None, None)
+        assert param_types[("run", "execution_mode")] == (
+            "enum",
+            ExecModes,
+            None,
+        )
+        assert param_types[("user", "email")] == ("email", None, None)
+        assert Initializer._get_param_types(model=InitConfig) is param_types
+
     def test_format_default_int(self):
         """Test method `._format_default()` with basic type."""
         ret = Initializer._format_default(value=0)
@@ -2,11 +2,12 @@
 
 from pathlib import Path
 
+from bidict import frozenbidict
 import pytest
 
 from zarp.config.enums import FieldNameMappingDirection
 
-from zarp.config.sample_tables import SampleTableProcessor
+from zarp.config.sample_tables import KEY_MAPPING, SampleTableProcessor
 
 TEST_FILE_DIR: Path = Path(__file__).parents[1].absolute() / "files"
 SAMPLE_TABLE: Path = TEST_FILE_DIR / "sample_table.tsv"
@@ -21,6 +22,8 @@ class TestSampleTableProcessor:
         assert hasattr(processor, "records")
         assert isinstance(processor.records, list)
         assert processor.records == []
+        assert processor.key_mapping is KEY_MAPPING
+        assert not hasattr(processor, "__dict__")
 
     def test_constructor_with_args(self):
         """Test class constructor with args."""
@@ -39,6 +42,14 @@ class TestSampleTableProcessor:
         processor.read(path=SAMPLE_TABLE)
         assert len(processor.records) == 5
 
+    def test_read_memory_map(self):
+        """Test ``.read()`` method with memory-mapped ZARP sample table."""
+        processor = SampleTableProcessor()
+        processor.read(path=SAMPLE_TABLE)
+        mapped_processor = SampleTableProcessor()
+        mapped_processor.read(path=SAMPLE_TABLE, memory_map=True)
+        assert mapped_processor.records == processor.records
+
     def test_write(self, tmpdir):
         """Test ``.write()`` method with valid ZARP sample table as input."""
         outfile = Path(tmpdir) / "sample_table.tsv"
@@ -49,80 +60,97 @@ class TestSampleTableProcessor:
         new_processor.read(path=outfile)
         assert len(new_processor.records) == 5
 
+    def test_write_missing_column(self, tmp_path):
+        """Test ``.write()`` method with records lacking a column."""
+        processor = SampleTableProcessor()
+        processor.read(path=SAMPLE_TABLE)
+        for record in processor.records:
+            del record["name"]
+        with pytest.raises(KeyError):
+            processor.write(path=tmp_path / "sample_table.tsv")
+
     def test_to_model_records(self):
         """Test ``._to_model_records()`` method."""
-        DELETED = [
-            "fq1",
-            "fq2",
-            "fq1_3p",
-            "fq2_3p",
-            "fq1_5p",
-            "fq2_5p",
-            "fq1_polya_3p",
-            "fq2_polya_3p",
-            "fq1_polya_5p",
-            "fq2_polya_5p",
-            "seqmode",
-        ]
-        NEW = [
-            "adapter_3p",
-            "adapter_5p",
-            "adapter_poly_3p",
-            "adapter_poly_5p",
-            "paths",
-        ]
+        DELETED = frozenset(
+            {
+                "fq1",
+                "fq2",
+                "fq1_3p",
+                "fq2_3p",
+                "fq1_5p",
+                "fq2_5p",
+                "fq1_polya_3p",
+                "fq2_polya_3p",
+                "fq1_polya_5p",
+                "fq2_polya_5p",
+                "seqmode",
+            }
+        )
+        NEW = frozenset(
+            {
+                "adapter_3p",
+                "adapter_5p",
+                "adapter_poly_3p",
+                "adapter_poly_5p",
+                "paths",
+            }
+        )
         processor = SampleTableProcessor()
         processor.read(path=SAMPLE_TABLE)
         processor._to_sample_table_records()
         new_processor = SampleTableProcessor(records=processor.records)
         new_processor._to_model_records(table_dir=SAMPLE_TABLE.parent)
         record = new_processor.records[0]
-        assert all(item not in record for item in DELETED)
-        assert all(item in record for item in NEW)
+        assert DELETED.isdisjoint(record)
+        assert NEW <= record.keys()
 
     def test_to_sample_table_records(self):
         """Test ``._to_sample_table_records()`` method."""
-        NEW = [
-            "fq1",
-            "fq2",
-            "fq1_3p",
-            "fq2_3p",
-            "fq1_5p",
-            "fq2_5p",
-            "fq1_polya_3p",
-            "fq2_polya_3p",
-            "fq1_polya_5p",
-            "fq2_polya_5p",
-        ]
-        DELETED = [
-            "adapter_3p",
-            "adapter_5p",
-            "adapter_poly_3p",
-            "adapter_poly_5p",
-            "paths",
-        ]
+        NEW = frozenset(
+            {
+                "fq1",
+                "fq2",
+                "fq1_3p",
+                "fq2_3p",
+                "fq1_5p",
+                "fq2_5p",
+                "fq1_polya_3p",
+                "fq2_polya_3p",
+                "fq1_polya_5p",
+                "fq2_polya_5p",
+            }
+        )
+        DELETED = frozenset(
+            {
+                "adapter_3p",
+                "adapter_5p",
+                "adapter_poly_3p",
+                "adapter_poly_5p",
+                "paths",
+            }
+        )
         processor = SampleTableProcessor()
         processor.read(path=SAMPLE_TABLE)
         processor._to_sample_table_records()
         record = processor.records[0]
-        assert all(item not in record for item in DELETED)
-        assert all(item in record for item in NEW)
+        assert DELETED.isdisjoint(record)
+        assert NEW <= record.keys()
 
     def test_translate_field_names(self):
         """Test ``._translate_field_names()`` method."""
-        from bidict import frozenbidict
-
         records = [
             {"a": "value_a1", "b": "value_b1"},
             {"a": "value_a2", "b": "value_b2"},
         ]
-        processor = SampleTableProcessor(records)
+        processor = SampleTableProcessor(
+            records=records,
+            key_mapping=frozenbidict({"a": "A", "b": "B"}),
+        )
         for record in processor.records:
             assert "a" in record
             assert "b" in record
             assert "A" not in record
             assert "B" not in record
-        processor.key_mapping = frozenbidict({"a": "A", "b": "B"})
         processor._translate_field_names(
             direction=FieldNameMappingDirection.TO_MODEL_PROPERTIES
         )
@@ -153,3 +181,11 @@ class TestSampleTableProcessor:
         path = SampleTableProcessor.resolve_path(anchor=anchor, path=path)
         assert isinstance(path, Path)
         assert str(path) == expected
+
+    def test_resolve_path_symlink(self, tmp_path):
+        """Test method ``.resolve_path()`` with a symbolic link."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (tmp_path / "link").symlink_to(target)
+        path = SampleTableProcessor.resolve_path(anchor=tmp_path, path="link")
+        assert path == target.resolve()
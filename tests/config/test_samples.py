@@ -1,7 +1,9 @@
 """Unit tests for ``:mod:zarp.config.samples``."""
 
 from pathlib import Path
+from typing import Tuple
 
+from pydantic import ValidationError
 import pytest
 
 from tests.utils import RaiseError
@@ -25,24 +27,52 @@ REF_SRA_TABLE: Path = TEST_FILE_DIR / "sra_table.tsv"
 REF_SRA_TABLE_2COLS: Path = TEST_FILE_DIR / "sra_table_2cols.tsv"
 REF_SRA_TABLE_NO_FILES: Path = TEST_FILE_DIR / "sra_table_no_files.tsv"
 REF_SRA_TABLE_EMPTY: Path = TEST_FILE_DIR / "sra_table_empty.tsv"
+REFS_STANDARD: Tuple[str, ...] = (
+    f"{REF_ID}",
+    f"sample@{REF_ID}",
+    f"{REF_FILE}",
+    f"sample@{REF_FILE}",
+    f"{REF_FILE},{REF_FILE}",
+    f"sample@{REF_FILE},{REF_FILE}",
+    f"table:{REF_TABLE}",
+)
 
 
-class TestSampleTableProcessor:
-    """Test ``:cls:zarp.config.samples.SampleProcessor`` class."""
+@pytest.fixture(scope="class")
+def run_config():
+    """Build run configuration shared by all tests of a class."""
+    return ConfigRun(
+        zarp_directory=TEST_FILE_DIR / "zarp",
+        genome_assemblies_map=TEST_FILE_DIR / "genome_assemblies.csv",
+    )
+
 
-    run_config = ConfigRun(
-        zarp_directory=Path(__file__).parents[1] / "files" / "zarp",
-        genome_assemblies_map=Path(__file__).parents[1]
-        / "files"
-        / "genome_assemblies.csv",
+@pytest.fixture(scope="session")
+def sample_update_dict():
+    """Build sample configuration update shared by all tests."""
+    return ConfigSample(source="test").dict()
+
+
+@pytest.fixture(scope="class")
+def processed_processor(run_config):
+    """Build processor with samples set from all references."""
+    processor = SampleProcessor(
+        *REFS_STANDARD,
+        sample_config=ConfigSample(),
+        run_config=run_config,
     )
+    processor.set_samples()
+    return processor
+
 
-    def test_constructor_without_refs(self):
+class TestSampleTableProcessor:
+    """Test ``:cls:zarp.config.samples.SampleProcessor`` class."""
+
+    def test_constructor_without_refs(self, run_config):
         """Test class constructor.
 
         Do not provide sample references.
         """
-        run_config = self.run_config.copy(deep=True)
         attributes = ["references", "sample_config", "run_config", "samples"]
         processor = SampleProcessor(
             sample_config=ConfigSample(),
@@ -53,40 +83,30 @@ class TestSampleTableProcessor:
         assert isinstance(processor.references, list)
         assert processor.references == []
         assert isinstance(processor.run_config, ConfigRun)
-        assert processor.run_config == self.run_config
+        assert processor.run_config == run_config
         assert isinstance(processor.sample_config, ConfigSample)
         assert processor.sample_config == ConfigSample()
         assert isinstance(processor.samples, list)
         assert processor.samples == []
+        assert not hasattr(processor, "__dict__")
 
-    def test_constructor_with_refs(self):
+    def test_constructor_with_refs(self, run_config):
         """Test class constructor.
 
         Use various sample_references.
         """
-        run_config = self.run_config.copy(deep=True)
-        refs = [
-            f"{REF_ID}",
-            f"sample@{REF_ID}",
-            f"{REF_FILE}",
-            f"sample@{REF_FILE}",
-            f"{REF_FILE},{REF_FILE}",
-            f"sample@{REF_FILE},{REF_FILE}",
-            f"table:{REF_TABLE}",
-        ]
         processor = SampleProcessor(
             sample_config=ConfigSample(),
             run_config=run_config,
-            *refs,
+            *REFS_STANDARD,
         )
-        assert processor.references == refs
+        assert processor.references == list(REFS_STANDARD)
 
-    def test_set_samples_no_refs(self):
+    def test_set_samples_no_refs(self, run_config):
         """Test method ``.set_samples()``.
 
         Do not provide sample references.
         """
-        run_config = self.run_config.copy(deep=True)
         processor = SampleProcessor(
             sample_config=ConfigSample(),
             run_config=run_config,
@@ -94,35 +114,18 @@ class TestSampleTableProcessor:
         processor.set_samples()
         assert len(processor.samples) == 0
 
-    def test_set_samples_refs(self):
+    def test_set_samples_refs(self, processed_processor):
         """Test method ``.set_samples()``.
 
         Use various sample references.
         """
-        run_config = self.run_config.copy(deep=True)
-        refs = [
-            f"{REF_ID}",
-            f"sample@{REF_ID}",
-            f"{REF_FILE}",
-            f"sample@{REF_FILE}",
-            f"{REF_FILE},{REF_FILE}",
-            f"sample@{REF_FILE},{REF_FILE}",
-            f"table:{REF_TABLE}",
-        ]
-        processor = SampleProcessor(
-            *refs,
-            sample_config=ConfigSample(),
-            run_config=run_config,
-        )
-        processor.set_samples()
-        assert len(processor.samples) > 5
+        assert len(processed_processor.samples) > 5
 
-    def test_set_samples_ref_invalid(self):
+    def test_set_samples_ref_invalid(self, run_config):
         """Test method ``.set_samples()``.
 
         Use invalid sample references.
         """
-        run_config = self.run_config.copy(deep=True)
         processor = SampleProcessor(
             f"{REF_INVALID}",
             sample_config=ConfigSample(),
@@ -131,12 +134,11 @@ class TestSampleTableProcessor:
         processor.set_samples()
         assert len(processor.samples) == 0
 
-    def test_set_samples_table_ref_empty(self):
+    def test_set_samples_table_ref_empty(self, run_config):
         """Test method ``.set_samples()``.
 
         Use reference to empty table.
         """
-        run_config = self.run_config.copy(deep=True)
         processor = SampleProcessor(
             f"table:{REF_FILE_EMPTY}",
             sample_config=ConfigSample(),
@@ -145,12 +147,11 @@ class TestSampleTableProcessor:
         processor.set_samples()
         assert len(processor.samples) == 0
 
-    def test_set_samples_table_ref_io(self, monkeypatch):
+    def test_set_samples_table_ref_io(self, run_config, monkeypatch):
         """Test method ``.set_samples()``.
 
         Use reference to empty table.
         """
-        run_config = self.run_config.copy(deep=True)
         processor = SampleProcessor(
             f"table:{REF_FILE_EMPTY}",
             sample_config=ConfigSample(),
@@ -164,12 +165,11 @@ class TestSampleTableProcessor:
         processor.set_samples()
         assert len(processor.samples) == 0
 
-    def test__process_sample_table(self):
+    def test__process_sample_table(self, run_config):
         """Test method ``._process_write_sample_table()``.
 
         Use sample table with entries accounting for all conditions.
         """
-        run_config = self.run_config.copy(deep=True)
         ref_str = f"table:{REF_TABLE}"
         processor = SampleProcessor(
             ref_str,
@@ -180,12 +180,11 @@ class TestSampleTableProcessor:
         assert ref.table_path is not None
         processor._process_sample_table(path=ref.table_path)
 
-    def test__process_sample_table_faulty(self):
+    def test__process_sample_table_faulty(self, run_config):
         """Test method ``._process_write_sample_table()``.
 
         Sample table contains faulty reference.
         """
-        run_config = self.run_config.copy(deep=True)
         ref_str = f"table:{REF_TABLE_FAULTY}"
         processor = SampleProcessor(
             ref_str,
@@ -196,12 +195,11 @@ class TestSampleTableProcessor:
         assert ref.table_path is not None
         processor._process_sample_table(path=ref.table_path)
 
-    def test__set_sample_from_local_lib_single(self):
+    def test__set_sample_from_local_lib_single(self, run_config):
         """Test method ``._set_sample_from_local_lib()``.
 
         Use reference for single-ended local library.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = str(REF_FILE_EMPTY)
         processor = SampleProcessor(
             ref,
@@ -215,14 +213,14 @@ class TestSampleTableProcessor:
         assert processor.samples[0].paths == (REF_FILE_EMPTY, None)
         assert processor.samples[0].identifier is None
 
-    def test__set_sample_from_local_lib_single_config_update(self):
+    def test__set_sample_from_local_lib_single_config_update(
+        self, run_config, sample_update_dict
+    ):
         """Test method ``._set_sample_from_local_lib()``.
 
         Use reference for single-ended local library and update configuration.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = str(REF_FILE_EMPTY)
-        update = ConfigSample(source="test")
         processor = SampleProcessor(
             ref,
             sample_config=ConfigSample(),
@@ -230,18 +228,20 @@ class TestSampleTableProcessor:
         )
         assert len(processor.samples) == 0
         deref = processor._resolve_sample_reference(ref=ref)
-        processor._set_sample_from_local_lib(ref=deref, update=update.dict())
+        processor._set_sample_from_local_lib(
+            ref=deref,
+            update=sample_update_dict,
+        )
         assert len(processor.samples) == 1
         assert processor.samples[0].paths == (REF_FILE_EMPTY, None)
         assert processor.samples[0].identifier is None
         assert processor.samples[0].source == "test"
 
-    def test__set_sample_from_local_lib_paired(self):
+    def test__set_sample_from_local_lib_paired(self, run_config):
         """Test method ``._set_sample_from_local_lib()``.
 
         Use reference for paired-ended local library.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = f"{REF_FILE_EMPTY},{REF_FILE_EMPTY}"
         processor = SampleProcessor(
             ref,
@@ -255,14 +255,14 @@ class TestSampleTableProcessor:
         assert processor.samples[0].paths == (REF_FILE_EMPTY, REF_FILE_EMPTY)
         assert processor.samples[0].identifier is None
 
-    def test__set_sample_from_local_lib_paired_config_update(self):
+    def test__set_sample_from_local_lib_paired_config_update(
+        self, run_config, sample_update_dict
+    ):
         """Test method ``._set_sample_from_local_lib()``.
 
         Use reference for paired-ended local library and update configuration.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = f"{REF_FILE_EMPTY},{REF_FILE_EMPTY}"
-        update = ConfigSample(source="test")
         processor = SampleProcessor(
             ref,
             sample_config=ConfigSample(),
@@ -270,18 +270,20 @@ class TestSampleTableProcessor:
         )
         assert len(processor.samples) == 0
         deref = processor._resolve_sample_reference(ref=ref)
-        processor._set_sample_from_local_lib(ref=deref, update=update.dict())
+        processor._set_sample_from_local_lib(
+            ref=deref,
+            update=sample_update_dict,
+        )
         assert len(processor.samples) == 1
         assert processor.samples[0].paths == (REF_FILE_EMPTY, REF_FILE_EMPTY)
         assert processor.samples[0].identifier is None
         assert processor.samples[0].source == "test"
 
-    def test__set_sample_from_remote_lib(self):
+    def test__set_sample_from_remote_lib(self, run_config):
         """Test method ``._set_sample_from_remote_lib()``.
 
         Use reference for remote library.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = REF_ID
         processor = SampleProcessor(
             ref,
@@ -295,14 +297,14 @@ class TestSampleTableProcessor:
         assert processor.samples[0].paths is None
         assert processor.samples[0].identifier == REF_ID
 
-    def test__set_sample_from_remote_lib_config_update(self):
+    def test__set_sample_from_remote_lib_config_update(
+        self, run_config, sample_update_dict
+    ):
         """Test method ``._set_sample_from_remote_lib()``.
 
         Use reference for remote library and update configuration.
         """
-        run_config = self.run_config.copy(deep=True)
         ref = REF_ID
-        update = ConfigSample(source="test")
         processor = SampleProcessor(
             ref,
             sample_config=ConfigSample(),
@@ -310,29 +312,59 @@ class TestSampleTableProcessor:
         )
         assert len(processor.samples) == 0
         deref = processor._resolve_sample_reference(ref=ref)
-        processor._set_sample_from_remote_lib(ref=deref, update=update.dict())
+        processor._set_sample_from_remote_lib(
+            ref=deref,
+            update=sample_update_dict,
+        )
         assert len(processor.samples) == 1
         assert processor.samples[0].paths is None
         assert processor.samples[0].identifier == REF_ID
         assert processor.samples[0].source == "test"
 
-    def test__set_samples_remote(self):
+    def test__set_sample_from_remote_lib_update_invalid(self, run_config):
+        """Test method ``._set_sample_from_remote_lib()``.
+
+        Use reference for remote library and invalid configuration update.
+        """
+        ref = REF_ID
+        processor = SampleProcessor(
+            ref,
+            sample_config=ConfigSample(),
+            run_config=run_config,
+        )
+        deref = processor._resolve_sample_reference(ref=ref)
+        with pytest.raises(ValidationError):
+            processor._set_sample_from_remote_lib(
+                ref=deref,
+                update={"fragment_length_distribution_mean": "invalid"},
+            )
+        assert len(processor.samples) == 0
+
+    def test__set_sample_from_remote_lib_defaults(self, run_config):
+        """Test method ``._set_sample_from_remote_lib()``.
+
+        Use reference for remote library and pass sample config defaults.
+        """
+        ref = REF_ID
+        processor = SampleProcessor(
+            ref,
+            sample_config=ConfigSample(),
+            run_config=run_config,
+        )
+        deref = processor._resolve_sample_reference(ref=ref)
+        defaults = ConfigSample(source="test").dict()
+        processor._set_sample_from_remote_lib(ref=deref, defaults=defaults)
+        assert len(processor.samples) == 1
+        assert processor.samples[0].identifier == REF_ID
+        assert processor.samples[0].source == "test"
+
+    def test__set_samples_remote(self, run_config):
         """Test method ``._set_samples_remote()``.
 
         Use references for remote libraries.
         """
-        run_config = self.run_config.copy(deep=True)
-        refs = [
-            f"{REF_ID}",
-            f"sample@{REF_ID}",
-            f"{REF_FILE}",
-            f"sample@{REF_FILE}",
-            f"{REF_FILE},{REF_FILE}",
-            f"sample@{REF_FILE},{REF_FILE}",
-            f"table:{REF_TABLE}",
-        ]
         processor = SampleProcessor(
-            *refs,
+            *REFS_STANDARD,
             sample_config=ConfigSample(),
             run_config=run_config,
         )
@@ -342,40 +374,24 @@ class TestSampleTableProcessor:
         assert len(processor.samples_remote) == 5
         assert len(processor.samples) == 11
 
-    def test_write_sample_table(self, tmpdir):
+    def test_write_sample_table(self, processed_processor, tmp_path):
         """Test method ``.write_sample_table()``.
 
         Use various sample references.
         """
-        run_config = self.run_config.copy(deep=True)
-        refs = [f"{REF_ID}"]
-        processor = SampleProcessor(
-            *refs,
-            sample_config=ConfigSample(),
-            run_config=run_config,
-        )
-        processor.set_samples()
-        processor.write_sample_table(
-            samples=processor.samples,
-            outpath=tmpdir / "samples.tsv",
+        processed_processor.write_sample_table(
+            samples=processed_processor.samples,
+            outpath=tmp_path / "samples.tsv",
         )
 
-    def test_write_remote_sample_table(self, tmpdir):
+    def test_write_remote_sample_table(self, processed_processor, tmp_path):
         """Test method ``.write_remote_sample_table()``.
 
         Use various sample references.
         """
-        run_config = self.run_config.copy(deep=True)
-        refs = [f"{REF_ID}"]
-        processor = SampleProcessor(
-            *refs,
-            sample_config=ConfigSample(),
-            run_config=run_config,
-        )
-        processor.set_samples()
-        processor.write_remote_sample_table(
-            samples=processor.samples,
-            outpath=tmpdir / "samples_remote.tsv",
+        processed_processor.write_remote_sample_table(
+            samples=processed_processor.samples,
+            outpath=tmp_path / "samples_remote.tsv",
         )
 
     @pytest.mark.parametrize(
@@ -399,15 +415,29 @@ class TestSampleTableProcessor:
         assert deref.table_path is None
 
     @pytest.mark.parametrize(
-        "ref",
+        "ref,expected_paths",
         [
-            f"{REF_FILE_EMPTY},{REF_FILE_EMPTY}",
-            f"{REF_FILE_EMPTY},{REF_FILE_EMPTY_2}",
-            f"{REF_FILE_EMPTY_2},{REF_FILE_EMPTY}",
-            f"{REF_FILE_EMPTY_2},{REF_FILE_EMPTY_2}",
+            (
+                f"{REF_FILE_EMPTY},{REF_FILE_EMPTY}",
+                (REF_FILE_EMPTY, REF_FILE_EMPTY),
+            ),
+            (
+                f"{REF_FILE_EMPTY},{REF_FILE_EMPTY_2}",
+                (REF_FILE_EMPTY, REF_FILE_EMPTY_2),
+            ),
+            (
+                f"{REF_FILE_EMPTY_2},{REF_FILE_EMPTY}",
+                (REF_FILE_EMPTY_2, REF_FILE_EMPTY),
+            ),
+            (
+                f"{REF_FILE_EMPTY_2},{REF_FILE_EMPTY_2}",
+                (REF_FILE_EMPTY_2, REF_FILE_EMPTY_2),
+            ),
         ],
     )
-    def test__resolve_sample_reference_unnamed_paired(self, ref):
+    def test__resolve_sample_reference_unnamed_paired(
+        self, ref, expected_paths
+    ):
         """Test method ``._resolve_sample_reference()``.
 
         Use references to unnamed paired-ended libaries.
@@ -416,9 +446,7 @@ class TestSampleTableProcessor:
         assert isinstance(deref, SampleReference)
         assert deref.type == SampleReferenceTypes.LOCAL_LIB_PAIRED.name
         assert deref.name is None
-        assert deref.lib_paths == tuple(
-            [Path(item) for item in ref.split(",", maxsplit=1)]
-        )
+        assert deref.lib_paths == expected_paths
         assert deref.identifier is None
         assert deref.table_path is None
 
@@ -448,13 +476,13 @@ class TestSampleTableProcessor:
         assert deref.table_path is None
 
     @pytest.mark.parametrize(
-        "ref",
+        "ref,expected_paths",
         [
-            f"sample@{REF_FILE_EMPTY}",
-            f"sample@{REF_FILE_EMPTY_2}",
+            (f"sample@{REF_FILE_EMPTY}", (REF_FILE_EMPTY, None)),
+            (f"sample@{REF_FILE_EMPTY_2}", (REF_FILE_EMPTY_2, None)),
         ],
     )
-    def test__resolve_sample_reference_named_single(self, ref):
+    def test__resolve_sample_reference_named_single(self, ref, expected_paths):
         """Test method ``._resolve_sample_reference()``.
 
         Use references to named single-ended libaries.
@@ -463,23 +491,34 @@ class TestSampleTableProcessor:
         assert isinstance(deref, SampleReference)
         assert deref.type == SampleReferenceTypes.LOCAL_LIB_SINGLE.name
         assert deref.name == "sample"
-        assert deref.lib_paths == (
-            Path(ref.split("@", maxsplit=1)[1]),
-            None,
-        )
+        assert deref.lib_paths == expected_paths
         assert deref.identifier is None
         assert deref.table_path is None
 
     @pytest.mark.parametrize(
-        "ref",
+        "ref,expected_paths",
         [
-            f"sample@{REF_FILE_EMPTY},{REF_FILE_EMPTY}",
-            f"sample@{REF_FILE_EMPTY},{REF_FILE_EMPTY_2}",
-            f"sample@{REF_FILE_EMPTY_2},{REF_FILE_EMPTY}",
-            f"sample@{REF_FILE_EMPTY_2},{REF_FILE_EMPTY_2}",
+            (
+                f"sample@{REF_FILE_EMPTY},{REF_FILE_EMPTY}",
+                (REF_FILE_EMPTY, REF_FILE_EMPTY),
+            ),
+            (
+                f"sample@{REF_FILE_EMPTY},{REF_FILE_EMPTY_2}",
+                (REF_FILE_EMPTY, REF_FILE_EMPTY_2),
+            ),
+            (
+                f"sample@{REF_FILE_EMPTY_2},{REF_FILE_EMPTY}",
+                (REF_FILE_EMPTY_2, REF_FILE_EMPTY),
+            ),
+            (
+                f"sample@{REF_FILE_EMPTY_2},{REF_FILE_EMPTY_2}",
+                (REF_FILE_EMPTY_2, REF_FILE_EMPTY_2),
+            ),
         ],
     )
-    def test__resolve_sample_reference_named_paired(self, ref):
+    def test__resolve_sample_reference_named_paired(
+        self, ref, expected_paths
+    ):
         """Test method ``._resolve_sample_reference()``.
 
         Use references to named paired-ended libaries.
@@ -488,10 +527,7 @@ class TestSampleTableProcessor:
         assert isinstance(deref, SampleReference)
         assert deref.type == SampleReferenceTypes.LOCAL_LIB_PAIRED.name
         assert deref.name == "sample"
-        paths = ref.split("@", maxsplit=1)[1]
-        assert deref.lib_paths == tuple(
-            [Path(item) for item in paths.split(",", maxsplit=1)]
-        )
+        assert deref.lib_paths == expected_paths
         assert deref.identifier is None
         assert deref.table_path is None
 
@@ -573,6 +609,19 @@ class TestSampleTableProcessor:
         assert isinstance(deref, SampleReference)
         assert deref.type == SampleReferenceTypes.INVALID.name
 
+    @pytest.mark.parametrize(
+        "paths,expected",
+        [
+            ([str(REF_FILE_EMPTY), str(REF_FILE_EMPTY_2)], True),
+            ([str(REF_FILE_EMPTY)], False),
+            ([str(REF_FILE_EMPTY)] * 3, False),
+            ([str(REF_FILE_EMPTY), str(REF_INVALID)], False),
+        ],
+    )
+    def test_are_files(self, paths, expected):
+        """Test method ``._are_files()``."""
+        assert SampleProcessor._are_files(paths=paths) is expected
+
     @pytest.mark.parametrize(
         "ref",
         [
@@ -7,13 +7,8 @@ import sys
 from traceback import format_exc
 from typing import Dict
 
-from rich.logging import RichHandler
-
 from zarp.config.args import ArgParser
 from zarp.config.enums import LogLevels
-from zarp.config.init import Initializer
-from zarp.config.parser import ConfigParser
-from zarp.zarp import ZARP
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +17,9 @@ def setup_logging(
     verbosity: str = "INFO",
 ) -> None:
     """Configure logging."""
+    # pylint: disable=import-outside-toplevel
+    from rich.logging import RichHandler
+
     level = LogLevels[verbosity].value
     logging.basicConfig(
         level=level,
@@ -32,7 +30,13 @@ def setup_logging(
 
 
 def main() -> None:  # pylint: disable=R0915
-    """Entry point for CLI executable."""
+    """Entry point for CLI executable.
+
+    Modules needed for initialization and normal mode are only imported once
+    the command-line arguments are parsed, so that help and version screens
+    are shown without delay.
+    """
+    # pylint: disable=import-outside-toplevel
     try:
         # create stack for log messages before logging is set up
         messages: Dict = {item.value: [] for item in LogLevels}
@@ -55,6 +59,10 @@ def main() -> None:  # pylint: disable=R0915
                 LOGGER.log(lvl, msg)
         LOGGER.debug("Logging set up")
 
+        from zarp.config.init import Initializer
+        from zarp.config.parser import ConfigParser
+        from zarp.zarp import ZARP
+
         # run in initialization mode
         if args.init or not args.config_file.is_file():
             if not args.config_file.is_file():
@@ -1,13 +1,16 @@
 """Command-line argument parser class."""
 
 import argparse
+from types import MappingProxyType
 from typing import (
     Dict,
-    List,
+    Mapping,
     Optional,
     Sequence,
+    Tuple,
 )
 from pathlib import Path
+import re
 import sys
 
 from zarp.config.enums import (
@@ -17,43 +20,76 @@ from zarp.config.enums import (
 )
 from zarp.version import __version__
 
+# lookup tables for converting choice arguments to enum members
+_DEPENDENCY_EMBEDDING_STRATEGIES: Dict[str, DependencyEmbeddingStrategies] = {
+    item.name: item for item in DependencyEmbeddingStrategies
+}
+_EXEC_MODES: Dict[str, ExecModes] = {item.name: item for item in ExecModes}
+
+# one or two comma-separated adapter sequences, either of which may be empty
+_ADAPTERS_PATTERN = re.compile(r"([^,]*)(?:,([^,]*))?")
+
+
+def _parse_adapters(value: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split adapter argument into sequences for first and second mates.
+
+    Args:
+        value: One adapter sequence or two adapter sequences separated by a
+            comma. Either sequence may be empty.
+
+    Returns:
+        Tuple of adapter sequences for first and second mates; empty or
+            missing sequences are set to ``None``.
+
+    Raises:
+        argparse.ArgumentTypeError: More than two sequences were passed.
+    """
+    match = _ADAPTERS_PATTERN.fullmatch(value)
+    if match is None:
+        raise argparse.ArgumentTypeError(
+            f"at most two comma-separated adapter sequences allowed: '{value}'"
+        )
+    return (match[1] or None, match[2] or None)
+
 
 class ArgParser:
     """ZARP-cli argument parser class."""
 
-    ARGUMENT_GROUPS: Dict[str, List[str]] = {
-        "sample": [
-            "adapter_3p",
-            "adapter_5p",
-            "adapter_poly_3p",
-            "adapter_poly_5p",
-            "annotations",
-            "fragment_length_distribution_mean",
-            "fragment_length_distribution_sd",
-            "read_orientation",
-            "reference_seqs",
-            "source",
-        ],
-        "run": [
-            "cores",
-            "dependency_embedding",
-            "description",
-            "execution_mode",
-            "genome_assemblies_map",
-            "identifier",
-            "profile",
-            "resources_version",
-            "rule_config",
-            "working_directory",
-            "zarp_directory",
-        ],
-        "user": [
-            "author",
-            "email",
-            "logo",
-            "url",
-        ],
-    }
+    ARGUMENT_GROUPS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+        {
+            "sample": (
+                "adapter_3p",
+                "adapter_5p",
+                "adapter_poly_3p",
+                "adapter_poly_5p",
+                "annotations",
+                "fragment_length_distribution_mean",
+                "fragment_length_distribution_sd",
+                "read_orientation",
+                "reference_seqs",
+                "source",
+            ),
+            "run": (
+                "cores",
+                "dependency_embedding",
+                "description",
+                "execution_mode",
+                "genome_assemblies_map",
+                "identifier",
+                "profile",
+                "resources_version",
+                "rule_config",
+                "working_directory",
+                "zarp_directory",
+            ),
+            "user": (
+                "author",
+                "email",
+                "logo",
+                "url",
+            ),
+        }
+    )
     DESCRIPTION = f"{sys.modules[__name__].__doc__}\n\n"
     EPILOG = (
         f"%(prog)s v{__version__}, (c) 2021 by Zavolab "
@@ -85,7 +121,11 @@ class ArgParser:
         )
 
     def set_arguments(self) -> None:
-        """Add arguments."""
+        """Add arguments.
+
+        If only version information is requested, sample-, run- and
+        user-specific arguments are not registered.
+        """
         self._set_general_arguments(
             argument_group=self.parser.add_argument_group(
                 title="general parameters",
@@ -101,6 +141,8 @@ class ArgParser:
                 ),
             )
         )
+        if self._is_version_only():
+            return
         self._set_sample_arguments(
             argument_group=self.parser.add_argument_group(
                 title="sample-related options",
@@ -148,6 +190,16 @@ class ArgParser:
             )
         )
 
+    def _is_version_only(self) -> bool:
+        """Check whether only version information is requested.
+
+        Returns:
+            ``True`` if option ``--version`` is passed, but neither ``-h`` nor
+                ``--help`` are.
+        """
+        args = sys.argv[1:] if self.args is None else self.args
+        return "--version" in args and not {"-h", "--help"} & set(args)
+
     @staticmethod
     def _set_general_arguments(
         argument_group: argparse._ArgumentGroup,  # pylint: disable=W0212
@@ -177,7 +229,7 @@ class ArgParser:
         )
         argument_group.add_argument(
             "--verbosity",
-            choices=[e.name for e in LogLevels],
+            choices=list(LogLevels.__members__),
             default="INFO",
             type=str,
             help="logging verbosity level",
@@ -223,7 +275,7 @@ class ArgParser:
         argument_group.add_argument(
             "--adapter-3p",
             default=None,
-            type=str,
+            type=_parse_adapters,
             metavar="STR",
             help=(
                 "adapter sequence to be truncated from the 3'-ends of reads;"
@@ -235,7 +287,7 @@ class ArgParser:
         argument_group.add_argument(
             "--adapter-5p",
             default=None,
-            type=str,
+            type=_parse_adapters,
             metavar="STR",
             help=(
                 "adapter sequence to be truncated from the 5'-ends of reads;"
@@ -247,7 +299,7 @@ class ArgParser:
         argument_group.add_argument(
             "--adapter-poly-3p",
             default=None,
-            type=str,
+            type=_parse_adapters,
             metavar="STR",
             help=(
                 "polynucleotide sequence to be truncated from the 3'-ends of"
@@ -260,7 +312,7 @@ class ArgParser:
         argument_group.add_argument(
             "--adapter-poly-5p",
             default=None,
-            type=str,
+            type=_parse_adapters,
             metavar="STR",
             help=(
                 "polynucleotide sequence to be truncated from the 3'-ends of"
@@ -384,7 +436,7 @@ class ArgParser:
         )
         argument_group.add_argument(
             "--dependency-embedding",
-            choices=[item.value for item in DependencyEmbeddingStrategies],
+            choices=list(_DEPENDENCY_EMBEDDING_STRATEGIES),
             default=None,
             type=str,
             help=(
@@ -401,7 +453,7 @@ class ArgParser:
         )
         argument_group.add_argument(
             "--execution-mode",
-            choices=[item.value for item in ExecModes],
+            choices=list(_EXEC_MODES),
             default=None,
             type=str,
             help=(
@@ -537,13 +589,13 @@ class ArgParser:
             setattr(
                 self.args_parsed,
                 "execution_mode",
-                ExecModes[self.args_parsed.execution_mode].value,
+                _EXEC_MODES[self.args_parsed.execution_mode].value,
             )
         if self.args_parsed.dependency_embedding is not None:
             setattr(
                 self.args_parsed,
                 "dependency_embedding",
-                DependencyEmbeddingStrategies[
+                _DEPENDENCY_EMBEDDING_STRATEGIES[
                     self.args_parsed.dependency_embedding
                 ],
             )
@@ -557,52 +609,6 @@ class ArgParser:
             except ValueError:
                 pass
 
-        # check for multiple values
-        if self.args_parsed.adapter_3p is not None:
-            adapters_3p = self.args_parsed.adapter_3p.split(",")
-            adapter_3p = tuple(
-                None if item == "" else item
-                for item in (
-                    (adapters_3p[0], adapters_3p[1])
-                    if len(adapters_3p) == 2
-                    else (adapters_3p[0], None)
-                )
-            )
-            setattr(self.args_parsed, "adapter_3p", adapter_3p)
-        if self.args_parsed.adapter_5p is not None:
-            adapters_5p = self.args_parsed.adapter_5p.split(",")
-            adapter_5p = tuple(
-                None if item == "" else item
-                for item in (
-                    (adapters_5p[0], adapters_5p[1])
-                    if len(adapters_5p) == 2
-                    else (adapters_5p[0], None)
-                )
-            )
-            setattr(self.args_parsed, "adapter_5p", adapter_5p)
-        if self.args_parsed.adapter_poly_3p is not None:
-            adapters_poly_3p = self.args_parsed.adapter_poly_3p.split(",")
-            adapter_poly_3p = tuple(
-                None if item == "" else item
-                for item in (
-                    (adapters_poly_3p[0], adapters_poly_3p[1])
-                    if len(adapters_poly_3p) == 2
-                    else (adapters_poly_3p[0], None)
-                )
-            )
-            setattr(self.args_parsed, "adapter_poly_3p", adapter_poly_3p)
-        if self.args_parsed.adapter_poly_5p is not None:
-            adapters_poly_5p = self.args_parsed.adapter_poly_5p.split(",")
-            adapter_poly_5p = tuple(
-                None if item == "" else item
-                for item in (
-                    (adapters_poly_5p[0], adapters_poly_5p[1])
-                    if len(adapters_poly_5p) == 2
-                    else (adapters_poly_5p[0], None)
-                )
-            )
-            setattr(self.args_parsed, "adapter_poly_5p", adapter_poly_5p)
-
     def set_argument_groups(self, attr: str = "grouped") -> None:
         """Parse command line (CLI) arguments.
 
@@ -610,10 +616,9 @@ class ArgParser:
             Parsed CLI arguments
         """
         # create dictionary of arg groups
+        parsed = vars(self.args_parsed)
         setattr(self.args_parsed, attr, {})
         for arg_group, arg_names in self.ARGUMENT_GROUPS.items():
             getattr(self.args_parsed, attr)[arg_group] = {
-                key: val
-                for key, val in vars(self.args_parsed).items()
-                if key in arg_names
+                key: parsed[key] for key in arg_names if key in parsed
             }
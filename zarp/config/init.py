@@ -6,12 +6,16 @@ A replacement will be provided in the package ``:mod:zarp``.
 """
 
 from enum import Enum
-from json import JSONDecodeError
+from functools import lru_cache
+from json import JSONDecodeError, loads
 import logging
 from os.path import expandvars
 from pathlib import Path
 import sys
 from typing import (
+    Any,
+    Callable,
+    Dict,
     List,
     Mapping,
     Optional,
@@ -21,22 +25,55 @@ from typing import (
     Union,
 )
 
-import jsonref  # type: ignore
 from pydantic import (  # pylint: disable=E0611
     BaseModel,
     ValidationError,
 )
 from yaml import (
-    safe_dump,
+    dump,
     YAMLError,
 )
 
 from zarp.config import enums
 from zarp.config.models import InitConfig
 from zarp.config.parser import ConfigParser
+from zarp.utils import SafeDumper
 
 LOGGER = logging.getLogger(__name__)
 
+# converters for user input by parameter type, along with the exceptions
+# raised for invalid input and the corresponding message to show
+_CONVERTERS: Dict[
+    str, Tuple[Callable[[str], Any], Tuple[Type[Exception], ...], str]
+] = {
+    "path": (
+        lambda value: Path(expandvars(value)).expanduser().resolve(),
+        (RuntimeError,),
+        "path could not be resolved",
+    ),
+    "integer": (int, (TypeError, ValueError), "not an integer"),
+    "number": (float, (TypeError, ValueError), "not a number"),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_schema(model: Type[BaseModel]) -> Dict:
+    """Get JSON schema of model with references resolved.
+
+    Schemas are cached per model class, as they do not change at runtime.
+
+    Args:
+        model: `:mod:Pydantic` model class.
+
+    Returns:
+        Dictionary representation of JSON schema.
+    """
+    # only needed for interactive initialization
+    # pylint: disable=import-outside-toplevel
+    import jsonref  # type: ignore
+
+    return jsonref.replace_refs(model.schema(), proxies=False)
+
 
 class Initializer:
     """Handler for app initialization.
@@ -46,8 +83,12 @@ class Initializer:
     """
 
     def __init__(self) -> None:
-        """Class constructor."""
-        self.config: InitConfig = InitConfig()
+        """Class constructor.
+
+        Defaults of the configuration model are validated instances already,
+        so the model is constructed without validating them again.
+        """
+        self.config: InitConfig = InitConfig.construct()
 
     def set_from_file(self, config_file: Path) -> None:
         """Set configuration based on configuration file contents.
@@ -69,7 +110,7 @@ class Initializer:
                     f"{config_file}"
                 ) from exc
 
-    def set_from_user_input(self) -> None:  # pylint: disable=R0912,R0915
+    def set_from_user_input(self) -> None:  # pylint: disable=R0912,R0914,R0915
         """Update configuration based on user input."""
         sys.stdout.write(
             """
@@ -89,20 +130,16 @@ having entered a value. Make sure to enter only _one_ value per query.
 
 """
         )
-        schema_full = jsonref.loads(InitConfig.schema_json())
+        schema_full = _get_schema(type(self.config))
+        param_types = self._get_param_types(model=type(self.config))
         for config_group in schema_full["properties"]:  # type: ignore
             for param, default in getattr(self.config, config_group):
-                schema = schema_full["properties"][  # type: ignore
-                    config_group
-                ]["allOf"][0]["properties"][
-                    param
-                ]  # type: ignore
                 choices: List = []
                 user_inputs: List = []
                 default = self._format_default(value=default)
-                param_type, param_class, item_type = self._get_param_type(
-                    schema=schema,  # type: ignore
-                )
+                param_type, param_class, item_type = param_types[
+                    (config_group, param)
+                ]
                 if param_class is not None and (
                     param_type == "enum" or item_type == "enum"
                 ):
@@ -130,34 +167,17 @@ having entered a value. Make sure to enter only _one_ value per query.
                     elif len(choices) > 0 and user_input not in choices:
                         sys.stdout.write("invalid choice\n")
                         continue
-                    # path
-                    elif param_type == "path":
-                        try:
-                            user_input = (
-                                Path(expandvars(user_input))  # type: ignore
-                                .expanduser()
-                                .resolve()
-                            )
-                        except RuntimeError:
-                            sys.stdout.write("path could not be resolved\n")
-                            continue
                     # array
                     elif param_type == "array":
                         user_inputs.append(user_input)
                         user_input = list(set(user_inputs))
-                    # integer
-                    elif param_type == "integer":
-                        try:
-                            user_input = int(user_input)  # type: ignore
-                        except (TypeError, ValueError):
-                            sys.stdout.write("not an integer\n")
-                            continue
-                    # float
-                    elif param_type == "number":
+                    # path, integer, float
+                    elif param_type in _CONVERTERS:
+                        convert, errors, message = _CONVERTERS[param_type]
                         try:
-                            user_input = float(user_input)  # type: ignore
-                        except (TypeError, ValueError):
-                            sys.stdout.write("not a number\n")
+                            user_input = convert(user_input)  # type: ignore
+                        except errors:
+                            sys.stdout.write(f"{message}\n")
                             continue
                     # update value with user input
                     try:
@@ -197,7 +217,7 @@ having entered a value. Make sure to enter only _one_ value per query.
         try:
             with open(path, "w", encoding="utf-8") as _file:
                 try:
-                    safe_dump(jsonref.loads(contents.json()), _file)
+                    dump(loads(contents.json()), _file, Dumper=SafeDumper)
                 except (JSONDecodeError, YAMLError) as exc:
                     raise ValueError(
                         f"contents are not valid YAML: {contents}"
@@ -247,6 +267,36 @@ having entered a value. Make sure to enter only _one_ value per query.
             pass
         return (_type, _class, _type_item)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_param_types(
+        model: Type[BaseModel],
+    ) -> Dict[
+        Tuple[str, str],
+        Tuple[Optional[str], Optional[Type[Enum]], Optional[str]],
+    ]:
+        """Return types of all properties of a grouped configuration model.
+
+        Types are determined once per model class.
+
+        Args:
+            model: `:mod:Pydantic` model class whose properties are groups of
+                parameters.
+
+        Returns:
+            Dictionary of property types as returned by `._get_param_type()`,
+                keyed by group and parameter name.
+        """
+        return {
+            (config_group, param): Initializer._get_param_type(schema=schema)
+            for config_group, group_schema in _get_schema(model)[
+                "properties"
+            ].items()
+            for param, schema in group_schema["allOf"][0][
+                "properties"
+            ].items()
+        }
+
     @staticmethod
     def _format_default(
         value: Optional[Union[Enum, int, List, str]],
@@ -283,12 +333,7 @@ having entered a value. Make sure to enter only _one_ value per query.
         Returns:
             Formatted prompt string.
         """
-        if choices is None:
-            choices = []
         asterisk = "*" if multi else ""
-        choices_clean: str = ""
+        choices_clean = f" {{{','.join(choices)}}}" if choices else ""
         param_clean = param.capitalize().replace("_", " ")
-        if len(choices) != 0:
-            choices_clean = f" {{{','.join(choices)}}}"
-        default_clean: str = str(default)
-        return f"{param_clean} [{default_clean}]{choices_clean}{asterisk}: "
+        return f"{param_clean} [{default}]{choices_clean}{asterisk}: "
@@ -34,6 +34,7 @@ class CustomBaseModel(BaseModel):
     class Config:
         """Configuration class."""
 
+        copy_on_model_validation = "none"
         use_enum_values = True
         validate_all = True
         validate_assignment = True
@@ -11,7 +11,7 @@ from typing import (
 from addict import Dict as Addict  # type: ignore
 from pydantic import ValidationError
 from yaml import (
-    safe_load,
+    load,
     YAMLError,
 )
 
@@ -21,7 +21,7 @@ from zarp.config.models import (
     ConfigSample,
     ConfigUser,
 )
-from zarp.utils import remove_none
+from zarp.utils import remove_none, SafeLoader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -114,9 +114,9 @@ class ConfigParser:
             ValueError: File is not valid YAML.
         """
         try:
-            with open(path, encoding="utf-8") as _file:
+            with open(path, "rb") as _file:
                 try:
-                    return safe_load(_file)
+                    return load(_file.read(), Loader=SafeLoader)
                 except YAMLError as exc:
                     raise ValueError(
                         f"file is not valid YAML: {path}"
@@ -6,6 +6,8 @@ Use ``:mod:zarp.samples.sample_table_processor`` instead.
 """
 
 from copy import deepcopy
+import csv
+import os
 from pathlib import Path
 import logging
 from typing import (
@@ -13,6 +15,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -24,6 +27,79 @@ from zarp.utils import list_get
 
 LOGGER = logging.getLogger(__name__)
 
+# bijective map: ZARP sample table column names <> Sample model properties
+# Cf.
+# https://github.com/zavolanlab/zarp/blob/ce1ce2ee2f37517967e6b8aaa0dc4cda3014e08e/pipeline_documentation.md#read-sample-table
+# some values are manually transformed
+KEY_MAPPING = frozenbidict(
+    {
+        "sample": "name",
+        "organism": "source",
+        "gtf": "annotations",
+        "genome": "reference_sequences",
+        "sd": "fragment_length_distribution_sd",
+        "mean": "fragment_length_distribution_mean",
+        "libtype": "read_orientation",
+        "index_size": "star_sjdb_overhang",
+        "kmer": "salmon_kmer_size",
+    }
+)
+
+# I/O buffer size for sample tables; fewer system calls for large tables
+BUFFER_SIZE = 1 << 20
+
+# sample table columns that are merged into model properties
+TABLE_ONLY_FIELDS = frozenset(
+    {
+        "fq1",
+        "fq2",
+        "fq1_3p",
+        "fq2_3p",
+        "fq1_5p",
+        "fq2_5p",
+        "fq1_polya_3p",
+        "fq2_polya_3p",
+        "fq1_polya_5p",
+        "fq2_polya_5p",
+        "seqmode",
+    }
+)
+# model properties that are split into or not written to sample table columns
+MODEL_ONLY_FIELDS = frozenset(
+    {
+        "adapter_3p",
+        "adapter_5p",
+        "adapter_poly_3p",
+        "adapter_poly_5p",
+        "id",
+        "paths",
+        "type",
+    }
+)
+
+# ZARP sample table columns, in output order
+TABLE_COLUMNS: Tuple[str, ...] = (
+    "sample",
+    "fq1",
+    "fq2",
+    "organism",
+    "gtf",
+    "genome",
+    "libtype",
+    "fq1_3p",
+    "fq2_3p",
+    "fq1_5p",
+    "fq2_5p",
+    "fq1_polya_3p",
+    "fq2_polya_3p",
+    "fq1_polya_5p",
+    "fq2_polya_5p",
+    "mean",
+    "sd",
+    "index_size",
+    "kmer",
+)
+
 
 class SampleTableProcessor:
     """Process ZARP sample tables.
@@ -32,70 +108,49 @@ class SampleTableProcessor:
 
     Args:
         records: List of sample table records.
+        key_mapping: Bijective map of sample table column names to sample
+            model properties.
 
     Attributes:
         records: List of sample table records.
+        key_mapping: Bijective map of sample table column names to sample
+            model properties.
     """
 
-    # bijective map: ZARP sample table column names <> Sample model properties
-    # Cf.
-    # https://github.com/zavolanlab/zarp/blob/ce1ce2ee2f37517967e6b8aaa0dc4cda3014e08e/pipeline_documentation.md#read-sample-table
-    # some values are manually transformed
-    key_mapping = frozenbidict(
-        {
-            "sample": "name",
-            "organism": "source",
-            "gtf": "annotations",
-            "genome": "reference_sequences",
-            "sd": "fragment_length_distribution_sd",
-            "mean": "fragment_length_distribution_mean",
-            "libtype": "read_orientation",
-            "index_size": "star_sjdb_overhang",
-            "kmer": "salmon_kmer_size",
-        }
-    )
-    col_order = [
-        "sample",
-        "fq1",
-        "fq2",
-        "organism",
-        "gtf",
-        "genome",
-        "libtype",
-        "fq1_3p",
-        "fq2_3p",
-        "fq1_5p",
-        "fq2_5p",
-        "fq1_polya_3p",
-        "fq2_polya_3p",
-        "fq1_polya_5p",
-        "fq2_polya_5p",
-        "mean",
-        "sd",
-        "index_size",
-        "kmer",
-    ]
+    __slots__ = ("records", "key_mapping")
 
     def __init__(
         self,
         records: Optional[List[Dict[str, Any]]] = None,
+        key_mapping: frozenbidict = KEY_MAPPING,
     ) -> None:
         """Class constructor."""
         self.records: List[Dict[str, Any]] = [] if records is None else records
+        self.key_mapping: frozenbidict = key_mapping
 
-    def read(self, path: Path) -> None:
+    def read(
+        self,
+        path: Path,
+        memory_map: bool = False,
+    ) -> None:
         """Read sample table.
 
         Args:
             path: Path to sample table.
+            memory_map: Whether to parse the table directly from a memory map
+                of the file rather than from read buffers. Ignored for empty
+                files, which cannot be mapped.
         """
         LOGGER.debug(f"Reading sample table: {path}")
-        data = pd.read_csv(
-            path,
-            comment="#",
-            sep="\t",
-            keep_default_na=False,
-        )
+        options: Dict[str, Any] = {
+            "comment": "#",
+            "sep": "\t",
+            "keep_default_na": False,
+        }
+        with open(path, "rb", buffering=BUFFER_SIZE) as _file:
+            if memory_map and os.fstat(_file.fileno()).st_size > 0:
+                options["memory_map"] = True
+            data = pd.read_csv(_file, **options)
         self.records = data.to_dict("records")  # type: ignore
         self._to_model_records(table_dir=path.parent)
         LOGGER.debug(f"Sample table records found: {len(self.records)}")
@@ -105,12 +160,28 @@ class SampleTableProcessor:
 
         Args:
             path: Path where sample table is to be written.
+
+        Raises:
+            KeyError: A sample table column is missing from all records.
         """
         LOGGER.debug(f"Writing sample table: {path}")
         self._to_sample_table_records()
-        data = pd.DataFrame(self.records)
-        data_reordered = data[self.col_order]
-        data_reordered.to_csv(path, sep="\t", index=False)
+        present = set().union(*(record.keys() for record in self.records))
+        missing = [col for col in TABLE_COLUMNS if col not in present]
+        if missing:
+            raise KeyError(f"Sample table columns missing: {missing}")
+        with open(
+            path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE
+        ) as _file:
+            writer = csv.DictWriter(
+                _file,
+                fieldnames=TABLE_COLUMNS,
+                delimiter="\t",
+                lineterminator="\n",
+                extrasaction="ignore",
+            )
+            writer.writeheader()
+            writer.writerows(self.records)
         LOGGER.debug(f"Records written: {len(self.records)}")
 
     def _to_model_records(self, table_dir: Path) -> None:
@@ -122,110 +193,116 @@ class SampleTableProcessor:
         self._translate_field_names(
             direction=FieldNameMappingDirection.TO_MODEL_PROPERTIES
         )
-        records: List[Dict[str, Any]] = []
-        for record in self.records:
-            rec_cp = {key: val for key, val in record.items() if val != ""}
-            rec_cp["paths"] = (
-                None
-                if rec_cp.get("fq1", None) is None
-                else self.resolve_path(anchor=table_dir, path=rec_cp["fq1"]),
-                None
-                if rec_cp.get("fq2", None) is None
-                else self.resolve_path(anchor=table_dir, path=rec_cp["fq2"]),
-            )
-            rec_cp["annotations"] = (
-                None
-                if rec_cp.get("annotations", None) is None
-                else self.resolve_path(
-                    anchor=table_dir, path=rec_cp["annotations"]
-                )
-            )
-            rec_cp["reference_sequences"] = (
-                None
-                if rec_cp.get("reference_sequences", None) is None
-                else self.resolve_path(
-                    anchor=table_dir,
-                    path=rec_cp["reference_sequences"],
-                )
-            )
-            rec_cp["adapter_3p"] = (
-                rec_cp.get("fq1_3p", None),
-                rec_cp.get("fq2_3p", None),
-            )
-            rec_cp["adapter_5p"] = (
-                rec_cp.get("fq1_5p", None),
-                rec_cp.get("fq2_5p", None),
-            )
-            rec_cp["adapter_poly_3p"] = (
-                rec_cp.get("fq1_polya_3p", None),
-                rec_cp.get("fq2_polya_3p", None),
-            )
-            rec_cp["adapter_poly_5p"] = (
-                rec_cp.get("fq1_polya_5p", None),
-                rec_cp.get("fq2_polya_5p", None),
-            )
-            rec_cp["sequencing_mode"] = rec_cp.get("seqmode", None)
-            entries_to_remove = [
-                "fq1",
-                "fq2",
-                "fq1_3p",
-                "fq2_3p",
-                "fq1_5p",
-                "fq2_5p",
-                "fq1_polya_3p",
-                "fq2_polya_3p",
-                "fq1_polya_5p",
-                "fq2_polya_5p",
-                "seqmode",
-            ]
-            for key in entries_to_remove:
-                _ = rec_cp.pop(key, None)
-            records.append(rec_cp)
-        self.records = records
+        self.records = [
+            self._to_model_record(record=record, anchor=table_dir)
+            for record in self.records
+        ]
 
     def _to_sample_table_records(self) -> None:
         """Transform model to sample table records."""
         self._translate_field_names(
             direction=FieldNameMappingDirection.TO_TABLE_COL_NAMES
         )
-        records: List[Dict[str, Any]] = []
-        for record in self.records:
-            rec_cp = deepcopy(record)
-            rec_cp["fq1"] = str(list_get(rec_cp.get("paths", []), 0, ""))
-            rec_cp["fq2"] = str(list_get(rec_cp.get("paths", []), 1, ""))
-            rec_cp["fq1_3p"] = list_get(rec_cp.get("adapter_3p", []), 0, "")
-            rec_cp["fq2_3p"] = list_get(rec_cp.get("adapter_3p", []), 1, "")
-            rec_cp["fq1_5p"] = list_get(rec_cp.get("adapter_5p", []), 0, "")
-            rec_cp["fq2_5p"] = list_get(rec_cp.get("adapter_5p", []), 1, "")
-            rec_cp["fq1_polya_3p"] = list_get(
-                rec_cp.get("adapter_poly_3p", []), 0, ""
-            )
-            rec_cp["fq2_polya_3p"] = list_get(
-                rec_cp.get("adapter_poly_3p", []), 1, ""
-            )
-            rec_cp["fq1_polya_5p"] = list_get(
-                rec_cp.get("adapter_poly_5p", []), 0, ""
-            )
-            rec_cp["fq2_polya_5p"] = list_get(
-                rec_cp.get("adapter_poly_5p", []), 1, ""
+        self.records = [
+            self._to_sample_table_record(record=record)
+            for record in self.records
+        ]
+
+    def _to_model_record(
+        self,
+        record: Dict[str, Any],
+        anchor: Path,
+    ) -> Dict[str, Any]:
+        """Transform sample table record to model record.
+
+        Args:
+            record: Sample table record with field names translated to model
+                properties.
+            anchor: Directory where sample table is located.
+
+        Returns:
+            Model record.
+        """
+        rec_cp = {key: val for key, val in record.items() if val != ""}
+        rec_cp["paths"] = (
+            None
+            if rec_cp.get("fq1", None) is None
+            else self.resolve_path(anchor=anchor, path=rec_cp["fq1"]),
+            None
+            if rec_cp.get("fq2", None) is None
+            else self.resolve_path(anchor=anchor, path=rec_cp["fq2"]),
+        )
+        rec_cp["annotations"] = (
+            None
+            if rec_cp.get("annotations", None) is None
+            else self.resolve_path(anchor=anchor, path=rec_cp["annotations"])
+        )
+        rec_cp["reference_sequences"] = (
+            None
+            if rec_cp.get("reference_sequences", None) is None
+            else self.resolve_path(
+                anchor=anchor,
+                path=rec_cp["reference_sequences"],
             )
-            rec_cp_clean = {
-                key: ("" if val is None else val)
-                for key, val in rec_cp.items()
-            }
-            entries_to_remove = [
-                "adapter_3p",
-                "adapter_5p",
-                "adapter_poly_3p",
-                "adapter_poly_5p",
-                "id",
-                "paths",
-                "type",
-            ]
-            for key in entries_to_remove:
-                _ = rec_cp_clean.pop(key, None)
-            records.append(rec_cp_clean)
-        self.records = records
+        )
+        rec_cp["adapter_3p"] = (
+            rec_cp.get("fq1_3p", None),
+            rec_cp.get("fq2_3p", None),
+        )
+        rec_cp["adapter_5p"] = (
+            rec_cp.get("fq1_5p", None),
+            rec_cp.get("fq2_5p", None),
+        )
+        rec_cp["adapter_poly_3p"] = (
+            rec_cp.get("fq1_polya_3p", None),
+            rec_cp.get("fq2_polya_3p", None),
+        )
+        rec_cp["adapter_poly_5p"] = (
+            rec_cp.get("fq1_polya_5p", None),
+            rec_cp.get("fq2_polya_5p", None),
+        )
+        rec_cp["sequencing_mode"] = rec_cp.get("seqmode", None)
+        return {
+            key: val
+            for key, val in rec_cp.items()
+            if key not in TABLE_ONLY_FIELDS
+        }
+
+    @staticmethod
+    def _to_sample_table_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform model record to sample table record.
+
+        Args:
+            record: Model record with field names translated to sample table
+                column names.
+
+        Returns:
+            Sample table record.
+        """
+        rec_cp = deepcopy(record)
+        rec_cp["fq1"] = str(list_get(rec_cp.get("paths", []), 0, ""))
+        rec_cp["fq2"] = str(list_get(rec_cp.get("paths", []), 1, ""))
+        rec_cp["fq1_3p"] = list_get(rec_cp.get("adapter_3p", []), 0, "")
+        rec_cp["fq2_3p"] = list_get(rec_cp.get("adapter_3p", []), 1, "")
+        rec_cp["fq1_5p"] = list_get(rec_cp.get("adapter_5p", []), 0, "")
+        rec_cp["fq2_5p"] = list_get(rec_cp.get("adapter_5p", []), 1, "")
+        rec_cp["fq1_polya_3p"] = list_get(
+            rec_cp.get("adapter_poly_3p", []), 0, ""
+        )
+        rec_cp["fq2_polya_3p"] = list_get(
+            rec_cp.get("adapter_poly_3p", []), 1, ""
+        )
+        rec_cp["fq1_polya_5p"] = list_get(
+            rec_cp.get("adapter_poly_5p", []), 0, ""
+        )
+        rec_cp["fq2_polya_5p"] = list_get(
+            rec_cp.get("adapter_poly_5p", []), 1, ""
+        )
+        return {
+            key: ("" if val is None else val)
+            for key, val in rec_cp.items()
+            if key not in MODEL_ONLY_FIELDS
+        }
 
     def _translate_field_names(
         self,
@@ -239,14 +316,16 @@ class SampleTableProcessor:
             direction: Direction of mapping. Either to model property or to
                 sample table column names.
         """
-        data = pd.DataFrame(self.records)
-        mapping = (
+        # plain dict lookups are cheaper than bidict lookups
+        mapping: Dict[str, str] = dict(
             self.key_mapping
             if direction == FieldNameMappingDirection.TO_MODEL_PROPERTIES
             else self.key_mapping.inv
         )
-        data_renamed = data.rename(columns=mapping)  # type: ignore
-        self.records = data_renamed.to_dict("records")  # type: ignore
+        self.records = [
+            {mapping.get(key, key): val for key, val in record.items()}
+            for record in self.records
+        ]
 
     @staticmethod
     def resolve_path(anchor: Union[Path, str], path: Union[Path, str]) -> Path:
@@ -257,6 +336,6 @@ class SampleTableProcessor:
             path: Path to resolve. If absolute, will be returned as is, but as
                 Path object.
         """
-        if Path(path).is_absolute():
+        if os.path.isabs(path):
             return Path(path)
         return (Path(anchor) / path).resolve()
@@ -8,10 +8,13 @@ class ``:class:zarp.abstract_classes.sample_processors.SampleProcessor``.
 """
 
 import logging
+import os
 from os.path import commonprefix
 from pathlib import Path
-from re import search
+import re
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -31,6 +34,10 @@ from zarp.config.sample_tables import SampleTableProcessor
 
 LOGGER = logging.getLogger(__name__)
 
+# sample reference patterns, compiled once at import
+_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\-\_\.]+$")
+_SEQ_IDENTIFIER_PATTERN = re.compile(r"^[DES]RR\d{7,}$", re.IGNORECASE)
+
 
 class SampleProcessor:
     """Process ZARP samples.
@@ -55,6 +62,14 @@ class SampleProcessor:
         samples_remote: List of remote sample objects.
     """
 
+    __slots__ = (
+        "references",
+        "sample_config",
+        "run_config",
+        "samples",
+        "samples_remote",
+    )
+
     def __init__(
         self,
         *args: str,
@@ -70,39 +85,53 @@ class SampleProcessor:
 
     def set_samples(self) -> None:
         """Resolve sample references and set sample configuration."""
-        for ref_str in self.references:
-            ref = self._resolve_sample_reference(ref=ref_str)
+        handlers: Dict[str, Callable[[SampleReference], None]] = {
+            SampleReferenceTypes.TABLE.name: self._set_samples_from_table,
+            SampleReferenceTypes.LOCAL_LIB_SINGLE.name: (
+                self._set_sample_from_local_lib
+            ),
+            SampleReferenceTypes.LOCAL_LIB_PAIRED.name: (
+                self._set_sample_from_local_lib
+            ),
+            SampleReferenceTypes.REMOTE_LIB_SRA.name: (
+                self._set_sample_from_remote_lib
+            ),
+        }
+        refs = [
+            self._resolve_sample_reference(ref=ref_str)
+            for ref_str in self.references
+        ]
+        for ref_str, ref in zip(self.references, refs):
             LOGGER.debug(f"Type of sample reference '{ref_str}': {ref.type}")
-            if (
-                ref.type == SampleReferenceTypes.TABLE.name
-                and ref.table_path is not None
-            ):
-                try:
-                    self._process_sample_table(path=ref.table_path)
-                except IOError as exc:
-                    LOGGER.warning(
-                        f"Cannot read table at '{ref.table_path}'. Skipping. "
-                        f"Original error: {exc}"
-                    )
-                except EmptyDataError:
-                    LOGGER.warning(
-                        f"Table at '{ref.table_path}' is empty. Skipping."
-                    )
-            elif ref.type in [
-                SampleReferenceTypes.LOCAL_LIB_SINGLE.name,
-                SampleReferenceTypes.LOCAL_LIB_PAIRED.name,
-            ]:
-                self._set_sample_from_local_lib(ref=ref)
-            elif ref.type == SampleReferenceTypes.REMOTE_LIB_SRA.name:
-                self._set_sample_from_remote_lib(ref=ref)
-            elif ref.type == SampleReferenceTypes.INVALID.name:
+            handler = handlers.get(ref.type)  # type: ignore
+            if handler is None:
                 LOGGER.warning(
                     f"Cannot determine type of sample reference '{ref_str}'. "
                     "Check spelling and refer to documentation for supported "
                     "syntax. Skipping."
                 )
+            else:
+                handler(ref)
         self._set_samples_remote()
 
+    def _set_samples_from_table(self, ref: SampleReference) -> None:
+        """Set sample configuration for all samples in a referenced table.
+
+        Args:
+            ref: Sample reference object for a sample table.
+        """
+        if ref.table_path is None:
+            return
+        try:
+            self._process_sample_table(path=ref.table_path)
+        except IOError as exc:
+            LOGGER.warning(
+                f"Cannot read table at '{ref.table_path}'. Skipping. "
+                f"Original error: {exc}"
+            )
+        except EmptyDataError:
+            LOGGER.warning(f"Table at '{ref.table_path}' is empty. Skipping.")
+
     def _process_sample_table(self, path: Path) -> None:
         """Set sample configuration for all samples in a sample table.
 
@@ -110,7 +139,8 @@ class SampleProcessor:
             path: Path to sample table.
         """
         table = SampleTableProcessor()
-        table.read(path=path)
+        table.read(path=path, memory_map=True)
+        defaults = self.sample_config.dict()
         for index, record in enumerate(table.records):
             deref = SampleReference()
             # sequence archive identifier
@@ -119,9 +149,11 @@ class SampleProcessor:
             ):
                 deref.type = SampleReferenceTypes.REMOTE_LIB_SRA
                 deref.identifier = record["name"].upper()
+                # remote libraries have no local paths
                 self._set_sample_from_remote_lib(
                     ref=deref,
-                    update=record,
+                    update={**record, "paths": None},
+                    defaults=defaults,
                 )
             # single-ended local library
             elif (
@@ -134,6 +166,7 @@ class SampleProcessor:
                 self._set_sample_from_local_lib(
                     ref=deref,
                     update=record,
+                    defaults=defaults,
                 )
             # paired-ended local library
             elif all(
@@ -151,6 +184,7 @@ class SampleProcessor:
                 self._set_sample_from_local_lib(
                     ref=deref,
                     update=record,
+                    defaults=defaults,
                 )
             # reference type invalid
             else:
@@ -170,6 +204,7 @@ class SampleProcessor:
         self,
         ref: SampleReference,
         update: Optional[Dict] = None,
+        defaults: Optional[Dict] = None,
     ) -> None:
         """Set sample configuration for local library.
 
@@ -178,24 +213,34 @@ class SampleProcessor:
                 paired-ended).
             update: Dictionary of sample configuration parameters to update. If
                 not set, class sample config is used.
+            defaults: Dictionary of class sample config parameters. If not
+                set, it is generated from the class sample config; pass it
+                to avoid regenerating it when setting many samples.
         """
         if update is None:
             update = {}
+        if defaults is None:
+            defaults = self.sample_config.dict()
         if ref.name is None and ref.lib_paths is not None:
             stems = [path.stem for path in ref.lib_paths if path is not None]
             ref.name = commonprefix(stems)
-        sample = Sample(
-            type=ref.type,
-            name=ref.name,
-            paths=ref.lib_paths,
-            **self.sample_config.dict(),
+        self.samples.append(
+            Sample(
+                **{
+                    **defaults,
+                    "type": ref.type,
+                    "name": ref.name,
+                    "paths": ref.lib_paths,
+                    **update,
+                }
+            )
         )
-        self.samples.append(sample.copy(update=update))  # type: ignore
 
     def _set_sample_from_remote_lib(
         self,
         ref: SampleReference,
         update: Optional[Dict] = None,
+        defaults: Optional[Dict] = None,
     ) -> None:
         """Set sample configuration for remote library.
 
@@ -204,18 +249,27 @@ class SampleProcessor:
                 paired-ended).
             update: Dictionary of sample configuration parameters to update. If
                 not set, class sample config is used.
+            defaults: Dictionary of class sample config parameters. If not
+                set, it is generated from the class sample config; pass it
+                to avoid regenerating it when setting many samples.
         """
         if update is None:
             update = {}
+        if defaults is None:
+            defaults = self.sample_config.dict()
         if ref.name is None:
             ref.name = ref.identifier
-        sample = Sample(
-            type=ref.type,
-            identifier=ref.identifier,
-            name=ref.name,
-            **self.sample_config.dict(),
+        self.samples.append(
+            Sample(
+                **{
+                    **defaults,
+                    "type": ref.type,
+                    "identifier": ref.identifier,
+                    "name": ref.name,
+                    **update,
+                }
+            )
         )
-        self.samples.append(sample.copy(update=update))  # type: ignore
 
     def _set_samples_remote(self) -> None:
         """Subset sample configuration for remote samples."""
@@ -277,49 +331,64 @@ class SampleProcessor:
         Returns:
             Dereferenced sample.
         """
-        deref = SampleReference(
-            ref=ref,
-            type=SampleReferenceTypes.INVALID,
-        )
-        parts: List
-        paths: List
-        if SampleProcessor._is_unnamed_single_end(ref=ref):
-            deref.type = SampleReferenceTypes.LOCAL_LIB_SINGLE
-            deref.lib_paths = (Path(ref).expanduser().resolve(), None)
-        elif SampleProcessor._is_named_single_end(ref=ref):
-            parts = ref.split("@", maxsplit=1)
-            deref.type = SampleReferenceTypes.LOCAL_LIB_SINGLE
-            deref.name = parts[0]
-            deref.lib_paths = (Path(parts[1]).expanduser().resolve(), None)
-        elif SampleProcessor._is_unnamed_paired_end(ref=ref):
-            paths = ref.split(",")
-            deref.type = SampleReferenceTypes.LOCAL_LIB_PAIRED
-            deref.lib_paths = (
+        # collect fields and validate them once, on construction, rather
+        # than on every assignment
+        fields: Dict[str, Any] = {"type": SampleReferenceTypes.INVALID}
+        # split reference once and test candidate types in order of priority;
+        # paths are checked as strings and only returned as Path objects
+        name, at_sign, rest = ref.partition("@")
+        is_named = bool(at_sign) and bool(_NAME_PATTERN.match(name))
+        paths = ref.split(",")
+        named_paths = rest.split(",")
+        if os.path.isfile(os.path.expanduser(ref)):
+            fields["type"] = SampleReferenceTypes.LOCAL_LIB_SINGLE
+            fields["lib_paths"] = (Path(ref).expanduser().resolve(), None)
+        elif is_named and os.path.isfile(os.path.expanduser(rest)):
+            fields["type"] = SampleReferenceTypes.LOCAL_LIB_SINGLE
+            fields["name"] = name
+            fields["lib_paths"] = (Path(rest).expanduser().resolve(), None)
+        elif SampleProcessor._are_files(paths=paths):
+            fields["type"] = SampleReferenceTypes.LOCAL_LIB_PAIRED
+            fields["lib_paths"] = (
                 Path(paths[0]).expanduser().resolve(),
                 Path(paths[1]).expanduser().resolve(),
             )
-        elif SampleProcessor._is_named_paired_end(ref):
-            parts = ref.split("@", maxsplit=1)
-            paths = parts[1].split(",")
-            deref.type = SampleReferenceTypes.LOCAL_LIB_PAIRED
-            deref.name = parts[0]
-            deref.lib_paths = (
-                Path(paths[0]).expanduser().resolve(),
-                Path(paths[1]).expanduser().resolve(),
+        elif is_named and SampleProcessor._are_files(paths=named_paths):
+            fields["type"] = SampleReferenceTypes.LOCAL_LIB_PAIRED
+            fields["name"] = name
+            fields["lib_paths"] = (
+                Path(named_paths[0]).expanduser().resolve(),
+                Path(named_paths[1]).expanduser().resolve(),
             )
-        elif SampleProcessor._is_unnamed_seq_identifier(ref=ref):
-            deref.type = SampleReferenceTypes.REMOTE_LIB_SRA
-            deref.identifier = ref.upper()
-        elif SampleProcessor._is_named_seq_identifier(ref=ref):
-            parts = ref.split("@", maxsplit=1)
-            deref.type = SampleReferenceTypes.REMOTE_LIB_SRA
-            deref.name = parts[0]
-            deref.identifier = parts[1].upper()
+        elif _SEQ_IDENTIFIER_PATTERN.match(ref):
+            fields["type"] = SampleReferenceTypes.REMOTE_LIB_SRA
+            fields["identifier"] = ref.upper()
+        elif is_named and _SEQ_IDENTIFIER_PATTERN.match(rest):
+            fields["type"] = SampleReferenceTypes.REMOTE_LIB_SRA
+            fields["name"] = name
+            fields["identifier"] = rest.upper()
         elif SampleProcessor._is_sample_table(ref=ref):
-            parts = ref.split(":", maxsplit=1)
-            deref.type = SampleReferenceTypes.TABLE
-            deref.table_path = Path(parts[1]).expanduser().resolve()
-        return deref
+            fields["type"] = SampleReferenceTypes.TABLE
+            fields["table_path"] = (
+                Path(ref.partition(":")[2]).expanduser().resolve()
+            )
+        return SampleReference(ref=ref, **fields)
+
+    @staticmethod
+    def _are_files(
+        paths: List[str],
+    ) -> bool:
+        """Check if paths are exactly two existing files.
+
+        Args:
+            paths: Paths to check.
+
+        Returns:
+            True if exactly two paths are given and both are files.
+        """
+        return len(paths) == 2 and all(
+            os.path.isfile(os.path.expanduser(path)) for path in paths
+        )
 
     @staticmethod
     def _is_unnamed_single_end(
@@ -347,11 +416,11 @@ class SampleProcessor:
         Returns:
             True if sample reference is a named single-end library.
         """
-        parts = ref.split("@", maxsplit=1)
+        name, at_sign, rest = ref.partition("@")
         return (
-            len(parts) == 2
-            and bool(search(r"^[a-zA-Z0-9\-\_\.]+$", parts[0]))
-            and Path(parts[1]).expanduser().is_file()
+            bool(at_sign)
+            and bool(_NAME_PATTERN.match(name))
+            and os.path.isfile(os.path.expanduser(rest))
         )
 
     @staticmethod
@@ -366,10 +435,7 @@ class SampleProcessor:
         Returns:
             True if sample reference is an unnamed paired-end library.
         """
-        paths = ref.split(",")
-        return len(paths) == 2 and all(
-            Path(path).expanduser().is_file() for path in paths
-        )
+        return SampleProcessor._are_files(paths=ref.split(","))
 
     @staticmethod
     def _is_named_paired_end(
@@ -383,15 +449,11 @@ class SampleProcessor:
         Returns:
             True if sample reference is a named paired-end library.
         """
-        parts = ref.split("@", maxsplit=1)
+        name, at_sign, rest = ref.partition("@")
         return (
-            len(parts) == 2
-            and bool(search(r"^[a-zA-Z0-9\-\_\.]+$", parts[0]))
-            and len(parts[1].split(",")) == 2
-            and all(
-                Path(path).expanduser().is_file()
-                for path in parts[1].split(",")
-            )
+            bool(at_sign)
+            and bool(_NAME_PATTERN.match(name))
+            and SampleProcessor._are_files(paths=rest.split(","))
         )
 
     @staticmethod
@@ -406,7 +468,7 @@ class SampleProcessor:
         Returns:
             True if sample reference is an unnamed sequence archive identifier.
         """
-        return bool(search(r"^[DES]RR\d{7,}$", ref.upper()))
+        return bool(_SEQ_IDENTIFIER_PATTERN.match(ref))
 
     @staticmethod
     def _is_named_seq_identifier(
@@ -420,11 +482,11 @@ class SampleProcessor:
         Returns:
             True if sample reference is a named sequence archive identifier.
         """
-        parts = ref.split("@", maxsplit=1)
+        name, at_sign, rest = ref.partition("@")
         return (
-            len(parts) == 2
-            and bool(search(r"^[a-zA-Z0-9\-\_\.]+$", parts[0]))
-            and bool(search(r"^[DES]RR\d{7,}$", parts[1].upper()))
+            bool(at_sign)
+            and bool(_NAME_PATTERN.match(name))
+            and bool(_SEQ_IDENTIFIER_PATTERN.match(rest))
         )
 
     @staticmethod
@@ -439,11 +501,11 @@ class SampleProcessor:
         Returns:
             True if sample reference is a sample table.
         """
-        parts = ref.split(":", maxsplit=1)
+        prefix, colon, path = ref.partition(":")
         return (
-            len(parts) == 2
-            and parts[0] == "table"
-            and Path(parts[1]).expanduser().is_file()
+            bool(colon)
+            and prefix == "table"
+            and os.path.isfile(os.path.expanduser(path))
         )
 
     @staticmethod
@@ -456,6 +518,6 @@ class SampleProcessor:
         """
         if _path == "":
             return ""
-        if not Path(_path).is_absolute():
+        if not os.path.isabs(_path):
             return str(anchor / _path)
         return _path
@@ -66,30 +66,27 @@ class SampleProcessorGenomePy(
             sanitize_strings
         )
 
-        # set assemblies
+        # resolve organism names and aliases in a single pass
         identifier_assembly_map: Dict = {}
-        for _, row in df.iterrows():
+        alias_long_name_map: Dict = {}
+        for organism_name, aliases, assembly in df.itertuples(
+            index=False, name=None
+        ):
             organisms = (
-                [row["organism"]] + row["aliases"].split(",")
-                if row["aliases"]
-                else [row["organism"]]
+                [organism_name] + aliases.split(",")
+                if aliases
+                else [organism_name]
             )
             for organism in organisms:
-                identifier_assembly_map[organism.strip()] = row["assembly"]
+                identifier_assembly_map[organism.strip()] = assembly
+                alias_long_name_map[organism.strip()] = organism_name
+
+        # set assemblies
         self.records["assembly"] = self.records["source_sanitized"].map(
             identifier_assembly_map
         )
 
         # set sanitized long source name
-        alias_long_name_map: Dict = {}
-        for _, row in df.iterrows():
-            organisms = (
-                [row["organism"]] + row["aliases"].split(",")
-                if row["aliases"]
-                else [row["organism"]]
-            )
-            for organism in organisms:
-                alias_long_name_map[organism.strip()] = row["organism"]
         self.records["source"] = self.records["source_sanitized"].map(
             alias_long_name_map
         )
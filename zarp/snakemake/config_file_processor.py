@@ -2,9 +2,10 @@
 
 import logging
 
-import yaml
+from yaml import dump
 
 from zarp.config.models import ConfigFileContent
+from zarp.utils import SafeDumper
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,8 +21,12 @@ class ConfigFileProcessor:
     """
 
     def __init__(self) -> None:
-        """Class constructor method."""
-        self.content: ConfigFileContent = ConfigFileContent()
+        """Class constructor method.
+
+        The placeholder content has no fields, so there is nothing to
+        validate.
+        """
+        self.content: ConfigFileContent = ConfigFileContent.construct()
 
     def set_content(self, content: ConfigFileContent) -> None:
         """Set content from object.
@@ -40,4 +45,8 @@ class ConfigFileProcessor:
         """
         LOGGER.debug(f"Writing configuration file to '{path}'...")
         with open(path, "w", encoding="utf-8") as _file:
-            yaml.dump(self.content.dict(exclude_none=exclude_none), _file)
+            dump(
+                self.content.dict(exclude_none=exclude_none),
+                _file,
+                Dumper=SafeDumper,
+            )
@@ -11,9 +11,15 @@ from typing import (
 )
 
 import pandas as pd
+import yaml
 
 from zarp.config.mappings import columns_zarp_path
 
+# YAML safe loader and dumper; use LibYAML bindings, if PyYAML was built with
+# them
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def generate_id(length: int = 6) -> str:
     """Generate random string.